@@ -23,7 +23,7 @@ class TuneGUIMainWindow(QMainWindow):
         self.ros2_client = ROS2ParameterClient(node)
         self.yaml_handler = YAMLHandler()
         self.params_file = params_file
-        self.mission_command_pub = MissionCommandPublisher(node)
+        self.mission_command_pub = MissionCommandPublisher()
         
         self.init_ui()
         self.setup_timers()
@@ -101,7 +101,8 @@ class TuneGUIMainWindow(QMainWindow):
         yaml_layout = QVBoxLayout(yaml_widget)
         yaml_layout.addWidget(QLabel("<b>params.yaml Parameters</b>"))
         
-        self.yaml_param_tree = ParameterTreeWidget()
+        # YAML edits stay local, so flush them at the end of the tick instead of debouncing
+        self.yaml_param_tree = ParameterTreeWidget(debounce_ms=0)
         self.yaml_param_tree.parameter_changed.connect(self.on_yaml_parameter_changed)
         yaml_layout.addWidget(self.yaml_param_tree)
         
@@ -153,7 +154,9 @@ class TuneGUIMainWindow(QMainWindow):
         
     def on_node_parameter_changed(self, param_name: str, new_value):
         """Handle parameter change in node parameter tree"""
-        node_name = self.node_selector.currentText()
+        # The tree's node, not the selector's: edits flushed during a node switch
+        # belong to the node that was shown when they were made
+        node_name = self.node_param_tree.node_name
         if not node_name:
             return
             
@@ -179,6 +182,8 @@ class TuneGUIMainWindow(QMainWindow):
             
     def load_yaml_file(self, file_path: str):
         """Load parameters from YAML file"""
+        # Edits to the current file must land before its data is replaced
+        self.yaml_param_tree.flush_pending_emits()
         try:
             self.yaml_handler.load_yaml(file_path)
             self.params_file = file_path
@@ -260,6 +265,8 @@ class TuneGUIMainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         self.param_refresh_timer.stop()
+        self.node_param_tree.flush_pending_emits()
+        self.yaml_param_tree.flush_pending_emits()
         event.accept()
 
 
@@ -281,11 +288,17 @@ def main(args=None):
     window.show()
     
     timer = QTimer()
-    timer.timeout.connect(lambda: rclpy.spin_once(node, timeout_sec=0))
+    def spin_ros():
+        rclpy.spin_once(node, timeout_sec=0)
+        # The mission command publisher is its own node and needs spinning too
+        rclpy.spin_once(window.mission_command_pub, timeout_sec=0)
+    
+    timer.timeout.connect(spin_ros)
     timer.start(10)  # Spin ROS2 every 10ms
     
     exit_code = app.exec_()
     
+    window.mission_command_pub.destroy_node()
     node.destroy_node()
     rclpy.shutdown()
     
@@ -1,40 +1,85 @@
 import rclpy
 from rclpy.node import Node
+from rclpy.executors import MultiThreadedExecutor
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
 
-from okmr_msgs import MissionCommand
+from okmr_msgs.msg import MissionCommand
 
 class MissionCommandPublisher(Node):
-    def __init__(self):
-        super().__init__('publisher')
-        self.publisher_ = self.create_publisher("okmr_msgs/msg/MissionCommand", "/mission_command", 2)
+    # Shared by every instance; built once at import instead of per node
+    QOS_PROFILE = QoSProfile(
+        depth=2,
+        reliability=ReliabilityPolicy.RELIABLE,
+        durability=DurabilityPolicy.VOLATILE
+    )
+    DEFAULT_NUM_THREADS = 2
+
+    def __init__(self, start_parameter_services: bool = True):
+        # The standalone node disables parameter services to keep them out of the
+        # executor's wait set; inside the GUI it stays a queryable node like any other
+        super().__init__('publisher', start_parameter_services=start_parameter_services)
+        self.publisher_ = self.create_publisher(MissionCommand, "/mission_command", self.QOS_PROFILE)
+        self.subscription = None
+        self._last_cmd = None
+        self._pending_echo = None  # Command we published whose echo has not arrived yet
+        self._msg = MissionCommand()  # Reused for every publish
+        
+        # sub_callback shares the echo state and message above, so it must not
+        # overlap with itself; being the only callback, nothing runs in parallel
+        self._callback_group = MutuallyExclusiveCallbackGroup()
         
+        self.declare_parameter('num_threads', self.DEFAULT_NUM_THREADS)
+
     def toggle_mission_control(self):
+        if self.subscription is not None:
+            return
         self.subscription = self.create_subscription(
             MissionCommand,
             '/mission_command',
             self.sub_callback,
-            10
+            10,
+            callback_group=self._callback_group
         )
-        self.subscription
-    
-    def sub_callback(self, msg):
-        msg = MissionCommand()
-        if(msg.command == 1):
-            msg.command = 2
-            self.publisher_.publish(msg)
-        else:
-            msg.command = 1
-            self.publisher_.publish(msg)
-        
+
+    def sub_callback(self, incoming):
+        # Our own publish comes back through the subscription exactly once
+        if self._pending_echo is not None and incoming.command == self._pending_echo:
+            self._pending_echo = None
+            return
+
+        cmd = 2 if incoming.command == 1 else 1
+        # Only publish when the command actually changes
+        if cmd == self._last_cmd:
+            return
+
+        self._msg.command = cmd
+        self.publisher_.publish(self._msg)
+        self._last_cmd = cmd
+        self._pending_echo = cmd
+
 def main(args=None):
     rclpy.init(args=args)
-    
-    mission_command_publisher = MissionCommandPublisher()
-    
-    rclpy.spin(mission_command_publisher)
-    
+
+    mission_command_publisher = MissionCommandPublisher(start_parameter_services=False)
+
+    # The parameter is declared as an integer, so only the range needs checking.
+    # The single mutually exclusive callback means extra threads add no throughput;
+    # the MultiThreadedExecutor is kept only so num_threads can be tuned later
+    num_threads = mission_command_publisher.get_parameter('num_threads').value
+    if num_threads < 1:
+        mission_command_publisher.get_logger().warn(
+            f"Invalid num_threads {num_threads!r}, using {MissionCommandPublisher.DEFAULT_NUM_THREADS}")
+        num_threads = MissionCommandPublisher.DEFAULT_NUM_THREADS
+    executor = MultiThreadedExecutor(num_threads=num_threads)
+    executor.add_node(mission_command_publisher)
+    try:
+        executor.spin()
+    finally:
+        executor.shutdown()
+
     mission_command_publisher.destroy_node()
     rclpy.shutdown()
-    
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import functools
+
 from PyQt5.QtWidgets import (QTreeWidget, QTreeWidgetItem, QStyledItemDelegate,
                              QLineEdit, QDoubleSpinBox, QSpinBox, QCheckBox, QWidget, QHBoxLayout)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QColor
 
 class Columns:
@@ -11,17 +13,102 @@ class Columns:
     VALUE = 1
     TYPE = 2
 
+_INT_TYPES = frozenset({'int', 'integer', 'int64'})
+_FLOAT_TYPES = frozenset({'float', 'double'})
+_BOOL_TYPES = frozenset({'bool', 'boolean'})
+
+_TRUE_STRS = frozenset({'true', '1', 'yes', 'on'})
+_FALSE_STRS = frozenset({'false', '0', 'no', 'off'})
+
+def _to_bool(value_str: str) -> bool:
+    """Parse a boolean from its accepted string spellings."""
+    val_lower = value_str.lower()
+    if val_lower in _TRUE_STRS:
+        return True
+    if val_lower in _FALSE_STRS:
+        return False
+    raise ValueError(f"Invalid boolean string: {value_str}")
+
+# Converters from edited text to a typed value, keyed by parameter category
+_COERCERS = {
+    'int': int,
+    'float': float,
+    'bool': _to_bool,
+    'str': str
+}
+
+# Built once at import rather than per inserted item
+_COLOR_MAP = {
+    'int': QColor(100, 200, 100),
+    'float': QColor(100, 150, 255),
+    'bool': QColor(255, 150, 100),
+    'str': QColor(200, 200, 100)
+}
+_GROUP_COLOR = QColor(150, 150, 150)
+
+@functools.lru_cache(maxsize=64)
 def get_param_category(type_name: str) -> str:
     """Normalize parameter type names to basic categories."""
     type_name = type_name.lower()
-    if type_name in ['int', 'integer', 'int64']:
+    if type_name in _INT_TYPES:
         return 'int'
-    elif type_name in ['float', 'double']:
+    elif type_name in _FLOAT_TYPES:
         return 'float'
-    elif type_name in ['bool', 'boolean']:
+    elif type_name in _BOOL_TYPES:
         return 'bool'
     return 'str'
 
+@functools.lru_cache(maxsize=8)
+def _paths_to_structure(paths: tuple[str, ...]) -> dict:
+    """Nest dotted parameter paths into a dict skeleton with None leaves.
+
+    The result is cached and shared between calls, so callers must not mutate it.
+    """
+    tree_structure = {}
+    split = str.split
+    
+    for param_path in paths:
+        parts = split(param_path, '.')
+        current = tree_structure
+        
+        for part in parts[:-1]:
+            current = current.setdefault(part, {})
+        
+        current[parts[-1]] = None
+        
+    return tree_structure
+
+def _make_int_editor(delegate, parent):
+    editor = QSpinBox(parent)
+    editor.setRange(-2147483648, 2147483647)
+    return editor
+
+def _make_float_editor(delegate, parent):
+    editor = QDoubleSpinBox(parent)
+    editor.setRange(-1e6, 1e6)
+    editor.setDecimals(4)
+    return editor
+
+def _make_bool_editor(delegate, parent):
+    container = QWidget(parent)
+    layout = QHBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+    
+    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    
+    checkbox = QCheckBox(container)
+    layout.addWidget(checkbox)
+    
+    checkbox.toggled.connect(delegate._on_bool_toggled)
+    return container
+
+# Editor constructors keyed by parameter category; anything else gets a QLineEdit
+_EDITOR_FACTORIES = {
+    'int': _make_int_editor,
+    'float': _make_float_editor,
+    'bool': _make_bool_editor
+}
+
 class ParameterItemDelegate(QStyledItemDelegate):
     """Custom delegate for parameter editing"""
     
@@ -38,32 +125,14 @@ class ParameterItemDelegate(QStyledItemDelegate):
         if item is None:
             return super().createEditor(parent, option, index)
             
-        param_type = item.text(Columns.TYPE)
-        category = get_param_category(param_type)
+        category = getattr(item, '_category', 'str')
         
-        if category == 'int':
-            editor = QSpinBox(parent)
-            editor.setRange(-2147483648, 2147483647)
-            return editor
-        elif category == 'float':
-            editor = QDoubleSpinBox(parent)
-            editor.setRange(-1e6, 1e6)
-            editor.setDecimals(4)
-            return editor
-        elif category == 'bool':
-            container = QWidget(parent)
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            checkbox = QCheckBox(container)
-            layout.addWidget(checkbox)
-            
-            checkbox.toggled.connect(lambda: self.commitAndClose(container))
-            return container
-        else:
-            return QLineEdit(parent)
+        factory = _EDITOR_FACTORIES.get(category)
+        return factory(self, parent) if factory else QLineEdit(parent)
+
+    def _on_bool_toggled(self):
+        """Commit the boolean editor container that owns the toggled checkbox"""
+        self.commitAndClose(self.sender().parentWidget())
 
     def commitAndClose(self, editor):
         """Helper to commit data and close editor immediately"""
@@ -92,7 +161,7 @@ class ParameterItemDelegate(QStyledItemDelegate):
         elif isinstance(editor, QWidget): # Boolean container
             checkbox = editor.findChild(QCheckBox)
             if checkbox:
-                is_checked = str(value).lower() in ['true', '1', 'yes', 'on']
+                is_checked = str(value).lower() in _TRUE_STRS
                 checkbox.blockSignals(True)
                 checkbox.setChecked(is_checked)
                 checkbox.blockSignals(False)
@@ -132,7 +201,9 @@ class ParameterTreeWidget(QTreeWidget):
     
     parameter_changed = pyqtSignal(str, object)  # (param_name, new_value)
     
-    def __init__(self, parent=None):
+    DEBOUNCE_MS = 100  # Rapid edits within this window collapse into one emission
+    
+    def __init__(self, parent=None, debounce_ms: int | None = None):
         super().__init__(parent)
         self.setColumnCount(3)
         self.setHeaderLabels(["Parameter", "Value", "Type"])
@@ -141,15 +212,35 @@ class ParameterTreeWidget(QTreeWidget):
         self.setColumnWidth(Columns.VALUE, 200)
         self.setColumnWidth(Columns.TYPE, 100)
         
+        # All rows share one height, so Qt can skip per-row sizeHint queries
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
+        self.setExpandsOnDoubleClick(False)
+        
         self.setItemDelegate(ParameterItemDelegate(self))
         self.itemChanged.connect(self.on_item_changed)
+        self.itemExpanded.connect(self._on_item_expanded)
         
+        self.node_name = None  # Node whose parameters are shown; pending edits target it
         self.parameters = {}
         self.param_to_item = {}
         self.updating = False
         
+        self._pending_emits = {}  # param_path -> latest value awaiting emission
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        # 0 still coalesces: everything queued this event loop tick is flushed together
+        self._emit_timer.setInterval(self.DEBOUNCE_MS if debounce_ms is None else debounce_ms)
+        self._emit_timer.timeout.connect(self.flush_pending_emits)
+        
     def set_parameters(self, node_name: str, parameters: dict):
         """Set parameters for a specific node"""
+        # Apply queued edits to the node they were made on before switching;
+        # done before blockSignals so parameter_changed still reaches listeners
+        self.flush_pending_emits()
+        self.node_name = node_name
+        
+        self.setUpdatesEnabled(False)
         self.blockSignals(True)
         try:
             self.clear()
@@ -160,9 +251,13 @@ class ParameterTreeWidget(QTreeWidget):
             self.expandAll()
         finally:
             self.blockSignals(False)
+            self.setUpdatesEnabled(True)
         
     def set_yaml_parameters(self, parameters: dict):
         """Set parameters from YAML file (flat structure)"""
+        self.flush_pending_emits()
+        
+        self.setUpdatesEnabled(False)
         self.blockSignals(True)
         try:
             self.clear()
@@ -170,53 +265,63 @@ class ParameterTreeWidget(QTreeWidget):
             self.param_to_item.clear()
             
             self._build_tree_from_paths(parameters)
-            self.expandAll()
         finally:
             self.blockSignals(False)
+            self.setUpdatesEnabled(True)
         
     def _build_tree(self, node_name: str, parameters: dict):
-        for param_name, param_info in parameters.items():
-            self._add_parameter_item(None, param_name, param_info)
+        self.addTopLevelItems([self._add_parameter_item(param_name, param_info)
+                               for param_name, param_info in parameters.items()])
             
     def _build_tree_from_paths(self, parameters: dict):
-        tree_structure = {}
+        # Reloading the same YAML reuses the cached skeleton; values are overlaid below
+        tree_structure = _paths_to_structure(tuple(parameters))
+        self.addTopLevelItems(self._add_tree_structure(tree_structure, [], parameters))
         
-        for param_path, value in parameters.items():
-            parts = param_path.split('.')
-            current = tree_structure
-            
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            
-            current[parts[-1]] = value
-            
-        self._add_tree_structure(None, tree_structure, [])
-        
-    def _add_tree_structure(self, parent, structure, path):
+    def _add_tree_structure(self, structure, path, parameters: dict) -> list[QTreeWidgetItem]:
+        """Build detached items for structure; the caller attaches them in one batch"""
+        items = []
         for key, value in structure.items():
             current_path = path + [key]
             
             if isinstance(value, dict):
-                item = QTreeWidgetItem(parent or self)
+                item = QTreeWidgetItem()
                 item.setText(Columns.NAME, key)
-                item.setForeground(Columns.NAME, QColor(150, 150, 150))
-                self._add_tree_structure(item, value, current_path)
+                item.setForeground(Columns.NAME, _GROUP_COLOR)
+                # Children are only built once the group is expanded
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+                item._structure = value
+                item._structure_path = current_path
             else:
                 param_path = '.'.join(current_path)
-                param_info = {'value': value, 'type': type(value).__name__}
-                self._add_parameter_item(parent, key, param_info, param_path)
+                param_value = parameters[param_path]
+                param_info = {'value': param_value, 'type': type(param_value).__name__}
+                item = self._add_parameter_item(key, param_info, param_path)
+            items.append(item)
+        return items
                 
-    def _add_parameter_item(self, parent, param_name: str, param_info: dict, full_path: str | None = None):
-        item = QTreeWidgetItem(parent or self)
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Populate a lazily built group the first time it is expanded"""
+        structure = getattr(item, '_structure', None)
+        if structure is None:
+            return
+        item._structure = None
+        
+        item.addChildren(self._add_tree_structure(structure, item._structure_path, self.parameters))
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+        
+    def _add_parameter_item(self, param_name: str, param_info: dict, full_path: str | None = None) -> QTreeWidgetItem:
+        """Create a detached item for a single parameter"""
+        item = QTreeWidgetItem()
         item.setText(Columns.NAME, param_name)
         
         value = param_info.get('value')
         param_type = param_info.get('type', type(value).__name__)
         
-        item.setText(Columns.VALUE, str(value))
+        str_value = str(value)
+        item.setText(Columns.VALUE, str_value)
         item.setData(Columns.VALUE, Qt.ItemDataRole.EditRole, value)
+        item._cached_str = str_value
         
         item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
         item.setText(Columns.TYPE, param_type)
@@ -226,61 +331,67 @@ class ParameterTreeWidget(QTreeWidget):
         self.param_to_item[path] = item
         
         category = get_param_category(param_type)
-        color_map = {
-            'int': QColor(100, 200, 100),
-            'float': QColor(100, 150, 255),
-            'bool': QColor(255, 150, 100),
-            'str': QColor(200, 200, 100)
-        }
+        # Cached on the item so the edit path avoids text() round-trips
+        item._category = category
+        item._path = path
         
-        if category in color_map:
-            item.setForeground(Columns.TYPE, color_map[category])
+        color = _COLOR_MAP.get(category)
+        if color:
+            item.setForeground(Columns.TYPE, color)
+            
+        return item
 
     def update_parameter_values(self, parameters: dict):
+        """Refresh displayed values, repainting once for the whole batch"""
         self.updating = True
-        for param_name, param_info in parameters.items():
-            item = self.param_to_item.get(param_name)
-            
-            if item:
-                new_value = param_info.get('value')
-                current_value = item.text(Columns.VALUE)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for param_name, param_info in parameters.items():
+                # An edit still waiting on the debounce would be overwritten by the old value
+                if param_name in self._pending_emits:
+                    continue
+                
+                item = self.param_to_item.get(param_name)
                 
-                if str(new_value) != current_value:
-                    item.setText(Columns.VALUE, str(new_value))
-                    item.setData(Columns.VALUE, Qt.ItemDataRole.EditRole, new_value)
+                if item:
+                    new_value = param_info.get('value')
+                    new_str = str(new_value)
                     
-        self.updating = False
+                    # _cached_str mirrors the value column text, avoiding item.text()
+                    if new_str != getattr(item, '_cached_str', None):
+                        item.setText(Columns.VALUE, new_str)
+                        item.setData(Columns.VALUE, Qt.ItemDataRole.EditRole, new_value)
+                        item._cached_str = new_str
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.updating = False
+        self.viewport().update()
         
     def on_item_changed(self, item: QTreeWidgetItem, column: int):
         if self.updating or column != Columns.VALUE:
             return
         
-        param_path = item.data(Columns.NAME, Qt.ItemDataRole.UserRole)
+        param_path = getattr(item, '_path', None)
         if not param_path:
             return
             
         new_value_str = item.text(Columns.VALUE)
-        param_type = item.text(Columns.TYPE)
-        category = get_param_category(param_type)
+        category = getattr(item, '_category', 'str')
         
         try:
-            new_value = None
-            if category == 'int':
-                new_value = int(new_value_str)
-            elif category == 'float':
-                new_value = float(new_value_str)
-            elif category == 'bool':
-                val_lower = new_value_str.lower()
-                if val_lower in ['true', '1', 'yes', 'on']:
-                    new_value = True
-                elif val_lower in ['false', '0', 'no', 'off']:
-                    new_value = False
-                else:
-                    raise ValueError(f"Invalid boolean string: {new_value_str}")
-            else:
-                new_value = new_value_str
+            new_value = _COERCERS[category](new_value_str)
             
-            self.parameter_changed.emit(param_path, new_value)
+            # Compare as str(value), the form _cached_str holds: Qt shows a bool
+            # EditRole as "true", so raw text would never match the cached "True"
+            new_str = str(new_value)
+            if new_str == getattr(item, '_cached_str', None):
+                return  # Unchanged, e.g. a commit re-setting the same value
+            
+            item._cached_str = new_str
+            self._pending_emits[param_path] = new_value
+            self._emit_timer.start()  # (Re)start the debounce window
             
         except ValueError:
             prev_value = item.data(Columns.VALUE, Qt.ItemDataRole.EditRole)
@@ -289,4 +400,13 @@ class ParameterTreeWidget(QTreeWidget):
                 
             self.updating = True
             item.setText(Columns.VALUE, str(prev_value))
-            self.updating = False
\ No newline at end of file
+            item._cached_str = str(prev_value)
+            self.updating = False
+            
+    def flush_pending_emits(self):
+        """Emit parameter_changed once per path edited during the debounce window"""
+        self._emit_timer.stop()
+        pending = self._pending_emits
+        self._pending_emits = {}
+        for param_path, new_value in pending.items():
+            self.parameter_changed.emit(param_path, new_value)